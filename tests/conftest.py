@@ -0,0 +1,31 @@
+import os
+import tempfile
+
+import pytest
+
+# O app lê DATABASE_URL ao ser importado. TEST_DATABASE_URL escolhe outro banco (ex.: PostgreSQL, ver
+# teste.md); sem ela, um SQLite temporário. O banco de testes é descartável: as tabelas são recriadas.
+_diretorio = tempfile.mkdtemp(prefix='chamados-testes-')
+os.environ['DATABASE_URL'] = os.environ.get('TEST_DATABASE_URL') or f'sqlite:///{os.path.join(_diretorio, "chamados.db")}'
+
+import app as modulo_app  # noqa: E402
+
+
+@pytest.fixture(scope='session')
+def app():
+    # Nenhum contexto fica ativo entre as requisições: cada uma tem o próprio `g`, como em produção
+    modulo_app.app.config.update(TESTING=True, SLA_VARREDURA_INTERVALO=0, DISTRIBUICAO_AUTOMATICA=False)
+    with modulo_app.app.app_context():
+        modulo_app.db.drop_all()
+        modulo_app.inicializar_banco()
+    return modulo_app.app
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def db(app):
+    return modulo_app.db
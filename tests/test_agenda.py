@@ -0,0 +1,46 @@
+from app import Usuario
+
+
+def login(client, identidade, senha):
+    resposta = client.post('/api/login', json={'username': identidade, 'password': senha})
+    return {'Authorization': f'Bearer {resposta.get_json()["token"]}'}
+
+
+def criar_evento(client, cabecalho, data):
+    resposta = client.post('/api/agenda', headers=cabecalho, json={
+        'titulo': 'Reunião', 'assunto': 'Pauta', 'data': data, 'hora_inicio': '14:00', 'hora_fim': '15:00',
+        'link_videoconferencia': 'https://exemplo.invalid/sala', 'sala': 'sala 2'
+    })
+    assert resposta.status_code == 201
+
+
+def test_etag_depende_dos_filtros(client):
+    cabecalho = login(client, '2222222222', 'agenda123')
+    criar_evento(client, cabecalho, '2032-05-10')
+
+    etag = client.get('/api/agenda?inicio=2032-05-10&fim=2032-05-10', headers=cabecalho).headers['ETag']
+    resposta = client.get('/api/agenda?inicio=2032-05-11&fim=2032-05-11', headers={**cabecalho, 'If-None-Match': etag})
+
+    assert resposta.status_code == 200
+    assert resposta.get_json() == []
+
+
+def test_renomear_organizador_invalida_o_etag(app, client, db):
+    cabecalho = login(client, '2222222222', 'agenda123')
+    criar_evento(client, cabecalho, '2032-06-10')
+    url = '/api/agenda?inicio=2032-06-10&fim=2032-06-10'
+    etag = client.get(url, headers=cabecalho).headers['ETag']
+
+    with app.app_context():
+        usuario = Usuario.query.filter_by(identidade_militar='2222222222').one()
+        nome_original = usuario.nome
+        usuario.nome = 'Agenda Renomeada'
+        db.session.commit()
+    try:
+        resposta = client.get(url, headers={**cabecalho, 'If-None-Match': etag})
+        assert resposta.status_code == 200
+        assert resposta.get_json()[0]['organizador_nome'] == 'Agenda Renomeada'
+    finally:
+        with app.app_context():
+            Usuario.query.filter_by(identidade_militar='2222222222').one().nome = nome_original
+            db.session.commit()
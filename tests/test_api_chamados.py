@@ -0,0 +1,80 @@
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+from app import Chamado, ContadorChamado, Usuario
+
+
+@contextmanager
+def contar_consultas(engine):
+    """Lista com cada comando SQL executado dentro do bloco"""
+    consultas = []
+
+    def registrar(conexao, cursor, comando, parametros, contexto, executemany):
+        consultas.append(comando)
+
+    event.listen(engine, 'before_cursor_execute', registrar)
+    try:
+        yield consultas
+    finally:
+        event.remove(engine, 'before_cursor_execute', registrar)
+
+
+def criar_chamados(db, quantidade):
+    """Substitui os chamados por `quantidade` linhas, cada uma com um solicitante diferente e metade com técnico.
+
+    Solicitantes distintos evitam que o identity map da sessão esconda uma consulta por linha.
+    """
+    db.session.query(Chamado).delete()
+    db.session.query(ContadorChamado).delete()
+    db.session.query(Usuario).filter(Usuario.identidade_militar.like('9%')).delete(synchronize_session=False)
+    db.session.execute(db.insert(Usuario), [{
+        'nome': f'Solicitante {numero}',
+        'identidade_militar': f'9{numero:09d}',
+        'senha': 'hash',
+        'nivel': 'usuario',
+        'secao': 'TI'
+    } for numero in range(quantidade)])
+    solicitantes = [usuario_id for (usuario_id,) in db.session.query(Usuario.id).filter(
+        Usuario.identidade_militar.like('9%')).order_by(Usuario.id)]
+    tecnico = Usuario.query.filter_by(nivel='tecnico').first()
+    db.session.execute(db.insert(Chamado), [{
+        'titulo': f'Chamado {numero}',
+        'descricao': 'Descrição',
+        'prioridade': 'media',
+        'categoria': 'Software',
+        'status': 'aberto',
+        'solicitante_id': solicitante_id,
+        'tecnico_id': tecnico.id if numero % 2 else None
+    } for numero, solicitante_id in enumerate(solicitantes)])
+    db.session.commit()
+
+
+def consultas_da_requisicao(client, engine, url):
+    client.get(url).get_data()  # Aquecimento: conexão do pool e caches
+    with contar_consultas(engine) as consultas:
+        resposta = client.get(url)
+        resposta.get_data()  # Respostas em stream executam as consultas durante a leitura
+    assert resposta.status_code == 200
+    return consultas
+
+
+@pytest.mark.parametrize('url', [
+    '/api/chamados',
+    '/api/chamados?limit=500',
+    '/api/chamados?fields=id,titulo,solicitante,tecnico',
+])
+def test_quantidade_de_consultas_nao_depende_do_numero_de_chamados(app, client, db, url):
+    with app.app_context():
+        engine = db.engine
+        criar_chamados(db, 10)
+    poucos = consultas_da_requisicao(client, engine, url)
+    dados = client.get(url).get_json()
+    assert len(dados['chamados'] if 'limit=' in url else dados) == 10
+
+    with app.app_context():
+        criar_chamados(db, 200)
+    muitos = consultas_da_requisicao(client, engine, url)
+
+    assert len(muitos) == len(poucos), muitos
@@ -0,0 +1,46 @@
+from app import Usuario, gerar_hash_senha, serializador_token
+
+
+def criar_usuario(app, db, identidade, nivel):
+    with app.app_context():
+        Usuario.query.filter_by(identidade_militar=identidade).delete()
+        usuario = Usuario(nome='Usuário temporário', identidade_militar=identidade,
+                          senha=gerar_hash_senha('senha123'), nivel=nivel, secao='TI')
+        db.session.add(usuario)
+        db.session.commit()
+        return usuario.id
+
+
+def token_de(app, identidade):
+    resposta = app.test_client().post('/api/login', json={'username': identidade, 'password': 'senha123'})
+    return {'Authorization': f'Bearer {resposta.get_json()["token"]}'}
+
+
+def test_token_deixa_de_valer_quando_o_nivel_muda(app, client, db):
+    usuario_id = criar_usuario(app, db, '8000000001', 'gestor')
+    cabecalho = token_de(app, '8000000001')
+    assert client.get('/api/tecnicos/carga', headers=cabecalho).status_code == 200
+
+    resposta = client.put(f'/api/usuarios/{usuario_id}', json={
+        'nome': 'Usuário temporário', 'identidade_militar': '8000000001', 'nivel': 'usuario', 'secao': 'TI'
+    })
+    assert resposta.status_code == 200
+    assert client.get('/api/tecnicos/carga', headers=cabecalho).status_code == 401
+
+
+def test_token_deixa_de_valer_quando_o_usuario_e_excluido(app, client, db):
+    usuario_id = criar_usuario(app, db, '8000000002', 'gestor')
+    cabecalho = token_de(app, '8000000002')
+    assert client.get('/api/tecnicos/carga', headers=cabecalho).status_code == 200
+
+    assert client.delete(f'/api/usuarios/{usuario_id}').status_code == 200
+    assert client.get('/api/tecnicos/carga', headers=cabecalho).status_code == 401
+
+
+def test_token_sem_carimbo_e_recusado(app, client):
+    token = serializador_token.dumps([1, 'Administrador', '1234567890', 'gestor', 'TI'])
+    assert client.get('/api/tecnicos/carga', headers={'Authorization': f'Bearer {token}'}).status_code == 401
+
+
+def test_id_do_usuario_como_token_e_recusado(client):
+    assert client.get('/api/busca?q=impressora', headers={'Authorization': 'Bearer 1'}).status_code == 401
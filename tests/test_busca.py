@@ -0,0 +1,54 @@
+import pytest
+
+from app import Chamado, _estado_busca, buscar_fts, buscar_like, busca_habilitada, criar_indice_busca
+
+TITULO = '<img src=x onerror=alert(1)> Zebraxss "aspas"'
+DESCRICAO = 'Texto <script>alert(2)</script> com zebraxss no meio & fim'
+
+
+@pytest.fixture
+def chamado_malicioso(app, db):
+    with app.app_context():
+        chamado = Chamado(titulo=TITULO, descricao=DESCRICAO, prioridade='baixa', categoria='Outros', solicitante_id=1)
+        db.session.add(chamado)
+        db.session.commit()
+        chamado_id = chamado.id
+    yield chamado_id
+    with app.app_context():
+        db.session.delete(db.session.get(Chamado, chamado_id))
+        db.session.commit()
+
+
+@pytest.mark.parametrize('buscar', [buscar_fts, buscar_like], ids=['fts', 'like'])
+def test_destaque_escapa_o_html_do_usuario(app, db, chamado_malicioso, buscar):
+    with app.app_context():
+        if buscar is buscar_fts and not busca_habilitada(db.session.connection()):
+            pytest.skip('SQLite sem FTS5')
+        resultado, = [r for r in buscar('zebraxss', ['chamado'], None, 10, 0) if r['id'] == chamado_malicioso]
+
+    assert resultado['titulo'] == ('&lt;img src=x onerror=alert(1)&gt; <mark>Zebraxss</mark> '
+                                   '&quot;aspas&quot;')
+    assert '<script>' not in resultado['trecho']
+    assert '&lt;script&gt;' in resultado['trecho']
+    assert '<mark>zebraxss</mark>' in resultado['trecho']
+    assert '&amp; fim' in resultado['trecho']
+
+
+def test_indice_criado_depois_passa_a_ser_usado(app, db):
+    with app.app_context():
+        if not busca_habilitada(db.session.connection()):
+            pytest.skip('SQLite sem FTS5')
+        db.session.rollback()
+        with db.engine.begin() as conexao:
+            conexao.exec_driver_sql('DROP TABLE busca_fts')
+        _estado_busca.clear()
+        try:
+            assert not busca_habilitada(db.session.connection())
+            db.session.rollback()
+        finally:
+            # O índice é criado "por outro processo": o estado deste worker fica como estava
+            estado_do_worker = dict(_estado_busca)
+            criar_indice_busca()
+            _estado_busca.clear()
+            _estado_busca.update(estado_do_worker)
+        assert busca_habilitada(db.session.connection())
@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+from app import Chamado, ContadorChamado, Usuario
+
+
+@pytest.fixture
+def cabecalho_gestor(app):
+    resposta = app.test_client().post('/api/login', json={'username': '1234567890', 'password': 'admin123'})
+    return {'Authorization': f'Bearer {resposta.get_json()["token"]}'}
+
+
+def importar(client, cabecalho, registros):
+    corpo = '\n'.join(json.dumps(registro) for registro in registros)
+    return client.post('/api/importar/chamados', data=corpo, headers=cabecalho, content_type='application/x-ndjson')
+
+
+VALIDO = {'titulo': 'Impressora', 'descricao': 'Sem toner', 'prioridade': 'media',
+          'categoria': 'Hardware', 'solicitante_id': 1}
+
+
+@pytest.mark.parametrize('registro, mensagem', [
+    ({'titulo': 'x'}, 'Registro 2: descricao, prioridade, categoria, solicitante_id obrigatório(s)'),
+    ({**VALIDO, 'prioridade': 'urgente'}, 'Registro 2: Prioridade inválida: urgente'),
+    ({**VALIDO, 'categoria': 'Telefonia'}, 'Registro 2: Categoria inválida: Telefonia'),
+    ({**VALIDO, 'status': 'pendente'}, 'Registro 2: Status inválido: pendente'),
+    ({**VALIDO, 'solicitante_id': 999999}, 'Registro 2: Solicitante 999999 não encontrado'),
+])
+def test_chamado_invalido_informa_o_registro_e_o_motivo(app, client, db, cabecalho_gestor, registro, mensagem):
+    with app.app_context():
+        antes = (Chamado.query.count(), db.session.query(db.func.sum(ContadorChamado.quantidade)).scalar())
+
+    resposta = importar(client, cabecalho_gestor, [VALIDO, registro])
+
+    assert resposta.status_code == 400
+    assert resposta.get_json()['error'] == f'Importação cancelada: {mensagem}'
+    with app.app_context():
+        assert (Chamado.query.count(), db.session.query(db.func.sum(ContadorChamado.quantidade)).scalar()) == antes
+
+
+@pytest.mark.parametrize('quantidade', [3, 12])
+def test_importa_usuarios_com_hash_das_senhas(app, client, db, cabecalho_gestor, monkeypatch, quantidade):
+    monkeypatch.setitem(app.config, 'SENHA_HASH_METODO', 'pbkdf2:sha256:1000')
+    identidades = [f'77{quantidade:02d}{i:06d}' for i in range(quantidade)]
+    registros = [{'nome': f'Importado {i}', 'identidade_militar': identidade, 'nivel': 'usuario',
+                  'secao': 'TI', 'senha': f'senha{i}'} for i, identidade in enumerate(identidades)]
+
+    resposta = client.post('/api/importar/usuarios', data='\n'.join(json.dumps(r) for r in registros),
+                           headers=cabecalho_gestor, content_type='application/x-ndjson')
+
+    assert resposta.status_code == 201, resposta.get_json()
+    login = client.post('/api/login', json={'username': identidades[-1], 'password': f'senha{quantidade - 1}'})
+    assert login.status_code == 200
+    with app.app_context():
+        Usuario.query.filter(Usuario.identidade_militar.in_(identidades)).delete()
+        db.session.commit()
@@ -0,0 +1,14 @@
+import pytest
+
+from app import planos_consultas_criticas
+
+
+def test_consultas_criticas_usam_indice(app, db):
+    with app.app_context():
+        if db.engine.dialect.name != 'sqlite':
+            pytest.skip('EXPLAIN QUERY PLAN só no SQLite')
+        planos = planos_consultas_criticas()
+
+    assert planos
+    sem_indice = {nome: plano for nome, plano, varreduras in planos if varreduras}
+    assert not sem_indice
@@ -0,0 +1,49 @@
+# Caminhos que dependem do banco (UPSERTs, Date/Time, Boolean): rodam no SQLite e, com TEST_DATABASE_URL, no PostgreSQL
+from app import Chamado
+
+
+def login(client, identidade, senha):
+    resposta = client.post('/api/login', json={'username': identidade, 'password': senha})
+    return {'Authorization': f'Bearer {resposta.get_json()["token"]}'}
+
+
+def test_contadores_acompanham_novo_chamado(client):
+    antes = client.get('/api/estatisticas').get_json()
+
+    resposta = client.post('/api/chamados', json={'titulo': 'Monitor', 'descricao': 'Não liga',
+                                                  'prioridade': 'alta', 'categoria': 'Hardware'})
+    assert resposta.status_code == 201
+
+    depois = client.get('/api/estatisticas').get_json()
+    assert depois['total_chamados'] == antes['total_chamados'] + 1
+    assert depois['por_prioridade']['alta'] == antes['por_prioridade'].get('alta', 0) + 1
+    assert isinstance(depois['por_secao']['TI']['total'], int)
+
+
+def test_agenda_grava_data_e_horas_e_muda_a_versao(client):
+    cabecalho = login(client, '2222222222', 'agenda123')
+    etag_antes = client.get('/api/agenda', headers=cabecalho).headers['ETag']
+
+    resposta = client.post('/api/agenda', headers=cabecalho, json={
+        'titulo': 'Reunião', 'assunto': 'Planejamento', 'data': '2031-03-04', 'hora_inicio': '09:30',
+        'hora_fim': '10:15', 'link_videoconferencia': 'https://exemplo.invalid/sala', 'sala': 'sala 1'
+    })
+    assert resposta.status_code == 201
+
+    resposta = client.get('/api/agenda?inicio=2031-03-04&fim=2031-03-04&limit=1', headers=cabecalho)
+    assert resposta.headers['ETag'] != etag_antes
+    evento, = resposta.get_json()['eventos']
+    assert (evento['data'], evento['hora_inicio'], evento['hora_fim']) == ('2031-03-04', '09:30', '10:15')
+
+
+def test_mensagem_do_chat_nasce_nao_lida(app, client, db):
+    with app.app_context():
+        chamado = Chamado(titulo='Rede', descricao='Sem acesso', prioridade='media', categoria='Rede',
+                          solicitante_id=1, status='em_andamento')
+        db.session.add(chamado)
+        db.session.commit()
+        chamado_id = chamado.id
+
+    assert client.post(f'/api/chat/{chamado_id}/enviar', json={'texto': 'Olá', 'usuario_id': 1}).status_code == 200
+    mensagem, = client.get(f'/api/chat/{chamado_id}/mensagens').get_json()
+    assert mensagem['lida'] is False
@@ -0,0 +1,26 @@
+from collections import namedtuple
+from datetime import datetime
+
+import pytest
+
+from app import IndiceSemelhantes
+
+Linha = namedtuple('Linha', 'id titulo descricao solucao categoria status data_fechamento')
+
+IMPRESSORA = ('Impressora não imprime', 'A impressora do setor mostra papel atolado', 'Removido o papel da bandeja')
+OUTROS = [
+    ('Senha expirada', 'Não consigo entrar no sistema de pessoal', 'Senha redefinida'),
+    ('Rede lenta', 'Internet muito lenta na sala de reuniões', 'Switch reiniciado'),
+]
+
+
+@pytest.mark.parametrize('outros', [0, 1, 2])
+def test_indice_pequeno_sugere_chamado_identico(outros):
+    indice = IndiceSemelhantes()
+    textos = [IMPRESSORA] + OUTROS[:outros]
+    indice.atualizar([Linha(i, titulo, descricao, solucao, 'Hardware', 'fechado', datetime(2024, 1, 1))
+                      for i, (titulo, descricao, solucao) in enumerate(textos, 1)])
+
+    sugestoes = indice.sugerir(*IMPRESSORA[:2])
+
+    assert sugestoes and sugestoes[0][0] == 1
@@ -0,0 +1,29 @@
+import json
+import logging
+
+import pytest
+
+from app import TAMANHO_BLOCO_JSON, resposta_json_lista
+
+
+def serializar(item):
+    if item == 'erro':
+        raise ValueError('item inválido')
+    return {'item': item}
+
+
+def test_erro_no_primeiro_bloco_ocorre_antes_da_resposta(app):
+    with app.test_request_context():
+        with pytest.raises(ValueError):
+            resposta_json_lista(['a', 'erro'], serializar)
+
+
+def test_erro_depois_dos_cabecalhos_fecha_o_array(app, caplog):
+    itens = ['a'] * TAMANHO_BLOCO_JSON + ['erro']
+    with app.test_request_context():
+        resposta = resposta_json_lista(itens, serializar)
+        with caplog.at_level(logging.ERROR):
+            corpo = resposta.get_data()
+
+    assert json.loads(corpo) == [{'item': 'a'}] * TAMANHO_BLOCO_JSON
+    assert 'Erro ao serializar a lista JSON em stream' in caplog.text